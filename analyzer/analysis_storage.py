@@ -5,6 +5,7 @@ This file maintains the original interface while splitting implementation across
 
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from contextlib import contextmanager
 import sqlalchemy as sa
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -28,17 +29,20 @@ class AnalysisStorage(AnalysisStorageBase, AnalysisStorageVector):
     Main AnalysisStorage class that combines all functionality.
     This class inherits from all helper classes to maintain the original interface.
     """
-    def __init__(self, storage_path: str = "./analysis_data"):
+    def __init__(self, storage_path: str = "./analysis_data", storage_url: Optional[str] = None):
         # Initialize the base class
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         
         # Initialize SQLite database
         self.db_path = self.storage_path / "analysis.db"
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        # An explicit storage_url (e.g. "sqlite:///:memory:") replaces the default database file
+        self.storage_url = storage_url
+        self.engine = create_engine(storage_url or f"sqlite:///{self.db_path}")
         
         # Check if database exists and perform migration if needed
-        if self.db_path.exists():
+        db_file = self._database_file()
+        if db_file is not None and db_file.exists():
             self._migrate_database_schema()
         
         Base.metadata.create_all(self.engine)
@@ -61,6 +65,45 @@ class AnalysisStorage(AnalysisStorageBase, AnalysisStorageVector):
         
         # Load metadata and consistency check
         self._load_metadata_and_validate()
+        
+        # Set while a bulk() transaction is open; FAISS vectors wait for its commit
+        self._in_bulk = False
+        self._pending_vectors = []
+       
+    @contextmanager
+    def bulk(self):
+        """Group writes into a single transaction that commits when the block exits"""
+        if self._in_bulk:
+            # Already inside an outer bulk() block, which owns the commit
+            yield
+            return
+        
+        self._in_bulk = True
+        try:
+            yield
+            self.session.commit()
+            for record_id, embedding, metadata in self._pending_vectors:
+                self._add_vector_to_faiss(record_id, embedding, metadata)
+        except Exception:
+            self.session.rollback()
+            raise
+        finally:
+            self._in_bulk = False
+            self._pending_vectors = []
+       
+    def _commit(self):
+        """Commit now, or only flush (to assign ids) inside a bulk() block"""
+        if self._in_bulk:
+            self.session.flush()
+        else:
+            self.session.commit()
+       
+    def _index_vector(self, record_id: int, embedding, metadata: Dict[str, Any]):
+        """Add a record's embedding to FAISS once the record is committed"""
+        if self._in_bulk:
+            self._pending_vectors.append((record_id, embedding, metadata))
+        else:
+            self._add_vector_to_faiss(record_id, embedding, metadata)
        
     def store_analysis(
                       self, 
@@ -69,6 +112,47 @@ class AnalysisStorage(AnalysisStorageBase, AnalysisStorageVector):
                       results: Dict[str, Any],
                       summary: str = "") -> int:
         """Store analysis results in database and vector store"""
+        analysis_record = self._build_analysis_record(codebase_path, analysis_type, results, summary)
+        self.session.add(analysis_record)
+        # Read the id and vector metadata before the commit expires the record, avoiding a refresh query
+        self.session.flush()
+        record_id, metadata = analysis_record.id, self._vector_metadata(analysis_record)
+        self._commit()
+         
+        # Generate and store vector embedding
+        embedding_text = self._prepare_embedding_text(results, summary)
+        embedding = self.embedding_model.encode(embedding_text)
+         
+        # Store in FAISS
+        self._index_vector(record_id, embedding, metadata)
+         
+        return record_id
+       
+    def store_analyses_bulk(self, records: List[Dict[str, Any]]) -> List[int]:
+        """Store several analyses in one transaction with one batched embedding pass"""
+        with self.bulk():
+            analysis_records = [self._build_analysis_record(**record) for record in records]
+            self.session.add_all(analysis_records)
+            self.session.flush()
+            # Captured while the flushed records are loaded; the commit at the end of bulk() expires them
+            record_ids = [analysis_record.id for analysis_record in analysis_records]
+             
+            embeddings = self.embedding_model.encode([
+                self._prepare_embedding_text(record['results'], record.get('summary', ''))
+                for record in records
+            ])
+            for analysis_record, embedding in zip(analysis_records, embeddings):
+                self._index_vector(analysis_record.id, embedding, self._vector_metadata(analysis_record))
+         
+        return record_ids
+       
+    def _build_analysis_record(
+                              self,
+                              codebase_path: str,
+                              analysis_type: str,
+                              results: Dict[str, Any],
+                              summary: str = "") -> AnalysisResult:
+        """Build the database record for an analysis without adding it to the session"""
          
         # Calculate metrics for trending
         metrics = self._calculate_metrics(results)
@@ -172,24 +256,18 @@ class AnalysisStorage(AnalysisStorageBase, AnalysisStorageVector):
             exception_count=viztracer_data.get('exception_count', 0),
             viztracer_execution_time=viztracer_data.get('execution_time', 0.0)
         )
-        
-        self.session.add(analysis_record)
-        self.session.commit()
          
-        # Generate and store vector embedding
-        embedding_text = self._prepare_embedding_text(results, summary)
-        embedding = self.embedding_model.encode(embedding_text)
-         
-        # Store in FAISS
-        self._add_vector_to_faiss(analysis_record.id, embedding, {
-            "codebase_path": codebase_path,
-            "analysis_type": analysis_type,
+        return analysis_record
+       
+    def _vector_metadata(self, analysis_record: AnalysisResult) -> Dict[str, Any]:
+        """FAISS metadata for a flushed analysis record"""
+        return {
+            "codebase_path": analysis_record.codebase_path,
+            "analysis_type": analysis_record.analysis_type,
             "timestamp": analysis_record.timestamp.isoformat(),
-            "analysis_status": analysis_status,
-            "failure_count": failure_count
-        })
-         
-        return analysis_record.id
+            "analysis_status": analysis_record.analysis_status,
+            "failure_count": analysis_record.failure_count
+        }
        
     def store_execution_logs(self, analysis_id: int, execution_failures: List[Dict[str, Any]]):
         """Store execution logs for an analysis in the execution_logs table"""
@@ -210,7 +288,7 @@ class AnalysisStorage(AnalysisStorageBase, AnalysisStorageVector):
             )
             self.session.add(execution_log)
          
-        self.session.commit()
+        self._commit()
         logger.info(f"Stored {len(execution_failures)} execution logs for analysis {analysis_id}")
        
     def get_execution_logs(self, analysis_id: int) -> List[Dict[str, Any]]:
@@ -17,16 +17,19 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class AnalysisStorageBase:
-    def __init__(self, storage_path: str = "./analysis_data"):
+    def __init__(self, storage_path: str = "./analysis_data", storage_url: Optional[str] = None):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
          
         # Initialize SQLite database
         self.db_path = self.storage_path / "analysis.db"
-        self.engine = create_engine(f"sqlite:///{self.db_path}")
+        # An explicit storage_url (e.g. "sqlite:///:memory:") replaces the default database file
+        self.storage_url = storage_url
+        self.engine = create_engine(storage_url or f"sqlite:///{self.db_path}")
          
         # Check if database exists and perform migration if needed
-        if self.db_path.exists():
+        db_file = self._database_file()
+        if db_file is not None and db_file.exists():
             self._migrate_database_schema()
          
         Base.metadata.create_all(self.engine)
@@ -50,18 +53,22 @@ class AnalysisStorageBase:
         # Load metadata and consistency check
         self._load_metadata_and_validate()
        
+    def _database_file(self) -> Optional[Path]:
+        """SQLite file behind self.engine, or None for in-memory and non-SQLite databases"""
+        url = self.engine.url
+        if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+            return None
+        return Path(url.database)
+       
     def _migrate_database_schema(self):
         """Migrate existing database schema to add new profiling columns"""
         try:
-            # Create a temporary engine to check existing schema
-            temp_engine = create_engine(f"sqlite:///{self.db_path}")
-            inspector = sa.inspect(temp_engine)
+            # A single PRAGMA lists the existing columns; no rows means the table does not exist
+            with self.engine.connect() as conn:
+                column_names = {row[1] for row in conn.execute(sa.text("PRAGMA table_info('analysis_results')"))}
              
             # Check if analysis_results table exists
-            if 'analysis_results' in inspector.get_table_names():
-                columns = inspector.get_columns('analysis_results')
-                column_names = {col['name'] for col in columns}
-                 
+            if column_names:
                 # List of new columns that need to be added
                 new_columns = [
                     'scalene_cpu_data', 'scalene_memory_data', 'scalene_gpu_data', 'scalene_ai_suggestions',
@@ -75,7 +82,7 @@ class AnalysisStorageBase:
                 ]
                  
                 # Add missing columns
-                with temp_engine.connect() as conn:
+                with self.engine.connect() as conn:
                     for column_name in new_columns:
                         if column_name not in column_names:
                             if column_name.endswith('_data') or column_name.endswith('_suggestions'):
@@ -241,12 +248,16 @@ class AnalysisStorageBase:
        
     def _backup_database_before_migration(self) -> bool:
         """Create backup of database before migration"""
+        db_file = self._database_file()
+        if db_file is None:
+            logger.error("Database backup is only supported for file-backed SQLite databases")
+            return False
         try:
             backup_path = self.storage_path / f"analysis_backup_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.db"
              
             # Copy database file
             import shutil
-            shutil.copy2(self.db_path, backup_path)
+            shutil.copy2(db_file, backup_path)
              
             logger.info(f"Database backup created at: {backup_path}")
             return True
@@ -257,10 +268,14 @@ class AnalysisStorageBase:
        
     def _restore_database_from_backup(self, backup_path: str) -> bool:
         """Restore database from backup"""
+        db_file = self._database_file()
+        if db_file is None:
+            logger.error("Database restore is only supported for file-backed SQLite databases")
+            return False
         try:
-            if not self.db_path.exists():
+            if not db_file.exists():
                 import shutil
-                shutil.copy2(backup_path, self.db_path)
+                shutil.copy2(backup_path, db_file)
                 logger.info(f"Database restored from backup: {backup_path}")
                 return True
             else:
@@ -275,8 +290,10 @@ class AnalysisStorageBase:
         """Get current migration status"""
         try:
             inspector = sa.inspect(self.engine)
+            db_file = self._database_file()
             status = {
-                'database_exists': self.db_path.exists(),
+                # In-memory and server databases exist for as long as the engine does
+                'database_exists': db_file.exists() if db_file is not None else True,
                 'tables': inspector.get_table_names(),
                 'version': self._get_database_version(),
                 'compatible': self._check_database_compatibility()
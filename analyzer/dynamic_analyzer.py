@@ -19,7 +19,7 @@ import traceback
 try:
     from analyzer.dynamic_analyzer_profiling import DynamicAnalyzerProfiling
     from analyzer.dynamic_analyzer_execution import DynamicAnalyzerExecution  
-    from analyzer.dynamic_analyzer_safe import DynamicAnalyzerSafe
+    from analyzer.dynamic_analyzer_safe import DynamicAnalyzerSafe, start_warm_pool, stop_warm_pool
     from analyzer.dynamic_analyzer_helpers import DynamicAnalyzerHelpers
     
     # Set flag indicating all helper classes are available
@@ -38,6 +38,10 @@ except ImportError as e:
         pass
     class DynamicAnalyzerHelpers:
         pass
+    def start_warm_pool():
+        return None
+    def stop_warm_pool():
+        pass
 
 class DynamicAnalyzer(DynamicAnalyzerBase):
     """
@@ -56,6 +60,16 @@ class DynamicAnalyzer(DynamicAnalyzerBase):
         
         # Set up method delegation for proper composition
         self._setup_method_delegation()
+    
+    @staticmethod
+    def start_pool():
+        """Start the shared warm worker that safe_execute_profiler reuses across scripts"""
+        return start_warm_pool()
+    
+    @staticmethod
+    def stop_pool():
+        """Stop the shared warm worker"""
+        stop_warm_pool()
      
     def _setup_method_delegation(self):
         """Set up proper method delegation using composition pattern"""
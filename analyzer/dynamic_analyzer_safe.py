@@ -7,8 +7,192 @@ import json
 import traceback
 import importlib.util
 import os
+import queue
+import threading
 from datetime import datetime
 from analyzer.dynamic_analyzer_base import DynamicAnalyzer as DynamicAnalyzerBase, ExecutionFailure, FailureType, FailureSeverity
+# Profiler output can be several MB of JSON; loads_json uses orjson when it is installed
+from analyzer.json_utils import loads_json
+
+# Execution body shared by the one-shot script and the warm worker: resolves the
+# profiler from a JSON request ({module, func, args, kwargs}) and returns a JSON-able response
+_EXECUTION_BODY = """
+import contextlib
+import sys
+import json
+import traceback
+import importlib
+import os
+
+# Add the analyzer directory to Python path to ensure modules are found
+analyzer_path = os.path.join(os.getcwd(), 'analyzer')
+if os.path.exists(analyzer_path):
+    sys.path.insert(0, analyzer_path)
+
+# Also add the current directory
+sys.path.insert(0, os.getcwd())
+
+def run_request(request):
+    try:
+        # Import the module containing the profiler function
+        module = importlib.import_module(request['module'])
+        
+        # Check if the function is a class method (starts with underscore)
+        if request['func'].startswith('_'):
+            # For class methods, create an instance and call the method
+            analyzer_instance = getattr(module, 'DynamicAnalyzer')()
+            profiler_func = getattr(analyzer_instance, request['func'])
+        else:
+            # For regular functions
+            profiler_func = getattr(module, request['func'])
+        
+        # Keep the profiled code's own output off stdout, which carries the response
+        with contextlib.redirect_stdout(sys.stderr):
+            result = profiler_func(*request['args'], **request['kwargs'])
+        return {'result': result}
+    except (Exception, SystemExit) as e:
+        # Return error information with full traceback
+        return {
+            'error': str(e),
+            'traceback': traceback.format_exc(),
+            'error_type': type(e).__name__
+        }
+"""
+
+# One-shot script: reads a single request from stdin and prints the response
+_ONE_SHOT_SCRIPT = _EXECUTION_BODY + """
+print(json.dumps(run_request(json.loads(sys.stdin.read())), default=str))
+"""
+
+# Warm worker loop: one JSON request per stdin line, one JSON reply per stdout line. The reply
+# carries the response text and the stderr captured while handling the request
+_WORKER_SCRIPT = _EXECUTION_BODY + """
+import io
+
+responses = sys.stdout
+for line in sys.stdin:
+    captured = io.StringIO()
+    with contextlib.redirect_stderr(captured):
+        response = run_request(json.loads(line))
+    responses.write(json.dumps({'stdout': json.dumps(response, default=str), 'stderr': captured.getvalue()}) + '\\n')
+    responses.flush()
+"""
+
+class _WarmWorkerPool:
+    """Long-lived profiler worker that avoids one interpreter startup per profiled script.
+
+    Every call runs in the same interpreter, so module state left behind by one profiler
+    call is visible to the next. Calls are only isolated from the analyzer process, not
+    from each other, which is why the pool is opt-in rather than the default.
+    """
+    def __init__(self):
+        # Forked children must not share the parent's worker pipes
+        self.owner_pid = os.getpid()
+        self._lock = threading.Lock()
+        self._process = None
+        self._stderr_file = None
+        self._started_with = None
+    
+    def _ensure_worker(self, env: Dict[str, str]):
+        """Start the worker, restarting it when the environment or cwd no longer match"""
+        started_with = (env, os.getcwd())
+        if self._process is not None and (self._process.poll() is not None or self._started_with != started_with):
+            self._terminate()
+        if self._process is None:
+            # Process-level stderr goes to a file so it can be reported if the worker dies
+            self._stderr_file = tempfile.TemporaryFile(mode='w+')
+            self._process = subprocess.Popen(
+                [sys.executable, '-c', _WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr_file,
+                text=True,
+                env=env
+            )
+            self._started_with = started_with
+    
+    def _worker_stderr(self) -> str:
+        """Everything the worker process wrote to its own stderr"""
+        if self._stderr_file is None:
+            return ""
+        self._stderr_file.seek(0)
+        return self._stderr_file.read()
+    
+    def _terminate(self):
+        """Kill the worker so the next request starts a fresh one"""
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+        if self._stderr_file is not None:
+            self._stderr_file.close()
+            self._stderr_file = None
+    
+    def run(self, command: List[str], request: str, env: Dict[str, str], timeout: float) -> subprocess.CompletedProcess:
+        """Run one profiler request in the worker, shaped like a subprocess.run() result"""
+        with self._lock:
+            self._ensure_worker(env)
+            process = self._process
+            try:
+                process.stdin.write(request + "\n")
+                process.stdin.flush()
+            except OSError as e:
+                stderr = self._worker_stderr()
+                self._terminate()
+                return subprocess.CompletedProcess(command, 1, stdout="", stderr=stderr or f"Warm worker unavailable: {e}")
+            
+            # Read on a helper thread so the timeout also works where pipes cannot be select()ed
+            replies = queue.Queue(maxsize=1)
+            threading.Thread(target=lambda: replies.put(process.stdout.readline()), daemon=True).start()
+            try:
+                line = replies.get(timeout=timeout)
+            except queue.Empty:
+                self._terminate()
+                raise subprocess.TimeoutExpired(command, timeout)
+            
+            if not line:
+                stderr = self._worker_stderr()
+                self._terminate()
+                return subprocess.CompletedProcess(command, 1, stdout="", stderr=stderr or "Warm worker exited unexpectedly")
+            try:
+                reply = json.loads(line)
+                return subprocess.CompletedProcess(command, 0, stdout=reply['stdout'], stderr=reply['stderr'])
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # A stray line (e.g. C-level writes to fd 1) desyncs the stream, so drop the worker
+                stderr = self._worker_stderr()
+                self._terminate()
+                return subprocess.CompletedProcess(command, 1, stdout="", stderr=stderr or f"Unexpected warm worker output: {line.strip()}")
+    
+    def close(self):
+        """Shut the worker down, letting it finish its request loop first"""
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.stdin.close()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+            self._terminate()
+
+_warm_pool = None
+
+def start_warm_pool() -> _WarmWorkerPool:
+    """Route safe_execute_profiler calls in this process through a warm worker.
+
+    Profiler calls then share one interpreter (see _WarmWorkerPool); call stop_warm_pool()
+    to go back to a fresh subprocess per call.
+    """
+    global _warm_pool
+    if _warm_pool is None or _warm_pool.owner_pid != os.getpid():
+        _warm_pool = _WarmWorkerPool()
+    return _warm_pool
+
+def stop_warm_pool():
+    """Shut down the warm worker and return to one subprocess per profiler call"""
+    global _warm_pool
+    if _warm_pool is not None and _warm_pool.owner_pid == os.getpid():
+        _warm_pool.close()
+    _warm_pool = None
 
 class DynamicAnalyzerSafe(DynamicAnalyzerBase):
     def safe_execute_profiler(self, script_path: Union[str, Path], profiler_func, *args, **kwargs) -> Dict[str, Any]:
@@ -28,61 +212,10 @@ class DynamicAnalyzerSafe(DynamicAnalyzerBase):
         try:
             # Convert Path to str for subprocess compatibility
             script_str = str(script_path) if isinstance(script_path, Path) else script_path
-               
-            # Create temporary execution script for isolation
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-                # Get the function source code and module information
-                func_module = profiler_func.__module__
-                func_name = profiler_func.__name__
-                   
-                # Write execution code that imports and runs the profiler
-                temp_file.write(f"""
-import sys
-import json
-import traceback
-import importlib
-import os
-
-# Add the analyzer directory to Python path to ensure modules are found
-analyzer_path = os.path.join(os.getcwd(), 'analyzer')
-if os.path.exists(analyzer_path):
-    sys.path.insert(0, analyzer_path)
-
-# Also add the current directory
-sys.path.insert(0, os.getcwd())
-
-try:
-    # Import the module containing the profiler function
-    module = importlib.import_module('{func_module}')
-     
-    # Check if the function is a class method (starts with underscore)
-    if '{func_name}'.startswith('_'):
-        # For class methods, create an instance and call the method
-        analyzer_class = getattr(module, 'DynamicAnalyzer')
-        analyzer_instance = analyzer_class()
-        profiler_func = getattr(analyzer_instance, '{func_name}')
-    else:
-        # For regular functions
-        profiler_func = getattr(module, '{func_name}')
-     
-    # Execute the profiler with provided arguments
-    result = profiler_func(*args, **kwargs)
-     
-    # Return successful result - ensure proper JSON serialization
-    result_dict = {{'result': result}}
-    print(json.dumps(result_dict, default=str))
-     
-    
-except Exception as e:
-    # Return error information with full traceback
-    error_dict = {{
-        'error': str(e),
-        'traceback': traceback.format_exc(),
-        'error_type': type(e).__name__
-    }}
-    print(json.dumps(error_dict))
-""")
-                temp_script = temp_file.name
+            
+            # Get the function source code and module information
+            func_module = profiler_func.__module__
+            func_name = profiler_func.__name__
                
             # Also ensure the analyzer directory is in the Python path for the subprocess
             env = os.environ.copy()
@@ -92,15 +225,28 @@ except Exception as e:
             else:
                 env['PYTHONPATH'] = analyzer_dir
                
-            # Execute in subprocess with timeout (180 seconds max)
-            result = subprocess.run([
-                sys.executable, temp_script, script_str
-            ], capture_output=True, text=True, timeout=180, env=env)
+            # Same request for both paths; args travel as JSON, so Path values arrive as str
+            request = json.dumps({'module': func_module, 'func': func_name, 'args': list(args), 'kwargs': kwargs}, default=str)
+            
+            if _warm_pool is not None and _warm_pool.owner_pid == os.getpid():
+                # Reuse the already-running worker interpreter (180 seconds max)
+                command = [sys.executable, '-c', '<warm worker>', script_str]
+                result = _warm_pool.run(command, request, env, timeout=180)
+            else:
+                # Create temporary execution script for isolation
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
+                    temp_file.write(_ONE_SHOT_SCRIPT)
+                    temp_script = temp_file.name
+                   
+                # Execute in subprocess with timeout (180 seconds max)
+                result = subprocess.run([
+                    sys.executable, temp_script, script_str
+                ], input=request, capture_output=True, text=True, timeout=180, env=env)
                
             # Parse and validate results
             if result.returncode == 0:
                 try:
-                    parsed = json.loads(result.stdout)
+                    parsed = loads_json(result.stdout)
                     if 'error' in parsed:
                         # Profiler execution failed - classify as tool error
                         failure = ExecutionFailure(
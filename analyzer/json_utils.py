@@ -0,0 +1,31 @@
+"""
+JSON Utilities Module
+
+Shared JSON reading and writing that uses orjson when it is installed and falls back
+to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, raising json.JSONDecodeError on malformed input"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json(data: Any, path: str):
+    """Write data to path as indented JSON"""
+    if orjson is not None:
+        # Accept the non-string keys json.dump allows, plus numpy values
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
@@ -36,7 +36,7 @@ def nested_function_calls():
     result2 = function_with_args(1, 2)
     result3 = function_with_return_value()
     
-    combined = f"{result1} - {result2} - {result3}"
+    combined = " - ".join((result1, format(result2), format(result3)))
     return combined
 
 def main():
@@ -3,23 +3,31 @@
 Test script to validate the safe execution wrapper functionality
 """
 
-import sys
 import os
-import tempfile
-import json
+import posixpath
+import sys
+import time
 from pathlib import Path
 
-# Add the analyzer directory to the path
-sys.path.insert(0, os.path.join(os.getcwd(), 'analyzer'))
+# Add the analyzer directory to the path (resolved from this file, added once)
+_ANALYZER_DIR = str(Path(__file__).resolve().parent.parent / 'analyzer')
+if _ANALYZER_DIR not in sys.path:
+    sys.path.insert(0, _ANALYZER_DIR)
 
+from functools import lru_cache
 from analyzer.dynamic_analyzer import DynamicAnalyzer
 #from dynamic_analyzer import DynamicAnalyzer
 
+@lru_cache(maxsize=1)
+def _analyzer():
+    """Return a shared DynamicAnalyzer so each test skips re-initialization"""
+    return DynamicAnalyzer()
+
 def test_successful_execution():
     """Test successful execution with safe_execute_profiler"""
     print("Testing successful execution...")
     
-    analyzer = DynamicAnalyzer()
+    analyzer = _analyzer()
     
     # Create a simple profiler function that just returns success
     def simple_profiler(script_path):
@@ -41,7 +49,7 @@ def test_error_handling():
     """Test error handling with safe_execute_profiler"""
     print("\nTesting error handling...")
     
-    analyzer = DynamicAnalyzer()
+    analyzer = _analyzer()
     
     # Create a profiler function that raises an exception
     def failing_profiler(script_path):
@@ -63,12 +71,12 @@ def test_timeout_functionality():
     """Test timeout functionality with safe_execute_profiler"""
     print("\nTesting timeout functionality...")
     
-    analyzer = DynamicAnalyzer()
+    analyzer = _analyzer()
     
-    # Create a profiler function that runs for a long time
+    # Create a slow profiler function. It stays far below the fixed 180s limit, so this
+    # only checks that a slow profiler completes; the timeout itself is never reached
     def long_running_profiler(script_path):
-        import time
-        time.sleep(5)  # This should timeout since default is 180 seconds but we'll test with a shorter one
+        time.sleep(0.1)
         return {"status": "completed"}
     
     try:
@@ -88,7 +96,7 @@ def test_import_error_handling():
     """Test import error handling"""
     print("\nTesting import error handling...")
     
-    analyzer = DynamicAnalyzer()
+    analyzer = _analyzer()
     
     def import_error_profiler(script_path):
         import non_existent_module  # This should cause an ImportError
@@ -110,7 +118,7 @@ def test_subprocess_isolation():
     """Test subprocess isolation"""
     print("\nTesting subprocess isolation...")
     
-    analyzer = DynamicAnalyzer()
+    analyzer = _analyzer()
     
     # Create a profiler that modifies global state
     global test_global_var
@@ -146,7 +154,7 @@ def test_environment_variables():
     """Test environment variable handling"""
     print("\nTesting environment variable handling...")
     
-    analyzer = DynamicAnalyzer()
+    analyzer = _analyzer()
     
     def env_checking_profiler(script_path):
         import os
@@ -166,6 +174,48 @@ def test_environment_variables():
         print(f"[FAILED] Environment variable test failed: {e}")
         return False
 
+def test_warm_pool():
+    """Test that the opt-in warm worker returns the same result as a fresh subprocess"""
+    print("\nTesting warm worker pool...")
+    
+    analyzer = _analyzer()
+    
+    # An importable module-level function, so the worker can resolve it by name
+    cold = analyzer.safe_execute_profiler("test_scripts/successful_script.py", posixpath.basename, "test_scripts/successful_script.py")
+    DynamicAnalyzer.start_pool()
+    try:
+        warm = analyzer.safe_execute_profiler("test_scripts/successful_script.py", posixpath.basename, "test_scripts/successful_script.py")
+    finally:
+        DynamicAnalyzer.stop_pool()
+    
+    print(f"Cold result: {cold}, warm result: {warm}")
+    if warm == cold == "successful_script.py":
+        print("[SUCCESS] Warm worker matches the one-shot subprocess")
+        return True
+    print("[FAILED] Warm worker result differs from the one-shot subprocess")
+    return False
+
+def test_warm_pool_stray_output():
+    """Test that output written around the warm worker's reply stream fails only that request"""
+    print("\nTesting warm worker stray output...")
+    
+    analyzer = _analyzer()
+    
+    DynamicAnalyzer.start_pool()
+    try:
+        # os.system's child writes straight to fd 1, ahead of the worker's reply
+        stray = analyzer.safe_execute_profiler("test_scripts/successful_script.py", os.system, "echo stray")
+        after = analyzer.safe_execute_profiler("test_scripts/successful_script.py", posixpath.basename, "test_scripts/successful_script.py")
+    finally:
+        DynamicAnalyzer.stop_pool()
+    
+    print(f"Stray output result: {stray}, next result: {after}")
+    if isinstance(stray, dict) and 'error' in stray and after == "successful_script.py":
+        print("[SUCCESS] Stray output failed one request and the next got its own reply")
+        return True
+    print("[FAILED] Stray output desynchronized the warm worker")
+    return False
+
 def main():
     """Run all tests"""
     print("Starting Safe Execution Wrapper Validation Tests\n")
@@ -176,7 +226,9 @@ def main():
         test_timeout_functionality,
         test_import_error_handling,
         test_subprocess_isolation,
-        test_environment_variables
+        test_environment_variables,
+        test_warm_pool,
+        test_warm_pool_stray_output
     ]
     
     results = []
@@ -10,21 +10,97 @@ This test validates:
 4. Storage schema migration functionality
 """
 
+import io
 import os
 import tempfile
-import json
 import time
 import sys
-from pathlib import Path
-from analyzer.dynamic_analyzer import DynamicAnalyzer
-from analyzer.analysis_storage import AnalysisStorage
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlalchemy import inspect, select, func
 from analyzer.analysis_storage_models import AnalysisResult
-from config.settings import settings
+from analyzer.json_utils import dump_json
+
+# Profiling columns the analysis_results table must provide
+_REQUIRED_PROFILING_COLUMNS = frozenset({
+    'scalene_cpu_data', 'scalene_memory_data', 'scalene_gpu_data',
+    'viztracer_call_data', 'viztracer_exception_data', 'viztracer_flow_data',
+    'scalene_timestamp', 'viztracer_timestamp',
+    'has_scalene_data', 'has_viztracer_data',
+    'scalene_coverage', 'viztracer_coverage',
+    'peak_memory_usage', 'cpu_hotspot_count',
+    'function_call_count', 'exception_count'
+})
+
+# Execution log levels that count as errors
+_ERROR_LEVELS = frozenset({'ERROR', 'CRITICAL'})
+
+# Result categories, in report order
+_CATEGORIES = ('storage_validation', 'data_retrieval', 'metrics_validation', 'schema_migration')
+
+# Report criterion label for each result category
+_CRITERIA_KEYS = (
+    ("✅ Profiling data is stored in database", 'storage_validation'),
+    ("✅ Data can be retrieved and queried correctly", 'data_retrieval'),
+    ("✅ Metrics calculation includes Scalene and VizTracer metrics", 'metrics_validation'),
+    ("✅ Storage schema migration works correctly", 'schema_migration'),
+)
+
+# Script every test profiles; storage tests only need some profiling output, not specific code
+_TEST_SCRIPT = 'def f():\n    return sum(range(100))\n\nprint(f())\n'
+
+# Codebase path and summary for the analysis each test category stores
+_TEST_ANALYSES = {
+    'storage_validation': ("t1_codebase", "Simple storage validation test analysis"),
+    'data_retrieval': ("t2_codebase", "Data retrieval test"),
+    'metrics_validation': ("t3_codebase", "Metrics validation test"),
+    'schema_migration': ("t4_codebase", "Schema migration test")
+}
+
+# Parts of the mock analysis result that do not depend on profiling output. Plain dicts rather
+# than MappingProxyType because they end up in a JSON column; nothing in storage mutates them.
+_EXECUTION_COVERAGE = {
+    'scripts_discovered': 1,
+    'scripts_analyzed': 1,
+    'scripts_skipped': 0,
+    'method_coverage': {
+        'scalene_profiling': 1,
+        'viztracer_tracing': 1
+    }
+}
+_ANALYSIS_COMPLETENESS = {
+    'status': 'complete',
+    'coverage_metrics': {
+        'overall_coverage': 100.0,
+        'completeness_context': 'Test analysis completed successfully'
+    }
+}
+
+def _make_analysis_result(scalene_result, viztracer_result):
+    """Create a mock dynamic analysis result carrying the given profiling data"""
+    return {
+        'analysis_results': {
+            'test.py': {
+                'scalene_profiling': scalene_result,
+                'viztracer_tracing': viztracer_result
+            }
+        },
+        'execution_coverage': _EXECUTION_COVERAGE,
+        'method_coverage_percentage': 100.0,
+        'execution_failures': [],
+        'failure_count': 0,
+        'issue_count': 0,
+        'analysis_completeness': _ANALYSIS_COMPLETENESS
+    }
 
 class SimpleStorageValidationTest:
     """Simple storage validation for profiling data"""
     
     def __init__(self):
+        # Imported here so collecting this module does not load the profilers or the embedding model
+        from analyzer.dynamic_analyzer import DynamicAnalyzer
+        from analyzer.analysis_storage import AnalysisStorage
+        
         self.test_results = {
             'storage_validation': [],
             'data_retrieval': [],
@@ -33,26 +109,94 @@ class SimpleStorageValidationTest:
         }
         self.start_time = time.time()
         
+        # Test output is buffered and written once per test
+        self._log = io.StringIO()
+        
+        # One in-memory storage instance shared by every test; each test records its own codebase path
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.storage = AnalysisStorage(self._temp_dir.name, storage_url="sqlite:///:memory:")
+        
+        # Schema migration and versioning only apply to a database file, so that test gets its own
+        self.file_storage = AnalysisStorage(os.path.join(self._temp_dir.name, "file_storage"))
+        
+        # The test script is written once and shared by every test
+        self._script_path = os.path.join(self._temp_dir.name, "test.py")
+        with open(self._script_path, "w") as f:
+            f.write(_TEST_SCRIPT)
+        
+        self._analyzer = DynamicAnalyzer()
+        
+    def _codebase_dir(self, category):
+        """Codebase path recorded for a category's analysis"""
+        return os.path.join(self._temp_dir.name, _TEST_ANALYSES[category][0])
+        
+    def _store_test_analyses(self):
+        """Profile the test script once and store every category's analysis"""
+        print("\n  Profiling test script and storing analyses...", file=self._log)
+        
+        # Both profilers run in subprocesses, so they can run side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            scalene_future = executor.submit(self._analyzer.profile_with_scalene, self._script_path)
+            viztracer_future = executor.submit(self._analyzer.trace_with_viztracer, self._script_path)
+            scalene_result, viztracer_result = scalene_future.result(), viztracer_future.result()
+        
+        analysis_result = _make_analysis_result(scalene_result, viztracer_result)
+        
+        records = {category: {
+            'codebase_path': self._codebase_dir(category),
+            'analysis_type': "dynamic",
+            'results': analysis_result,
+            'summary': summary
+        } for category, (_, summary) in _TEST_ANALYSES.items()}
+        
+        # Every other category shares one bulk write to the in-memory storage
+        migration_record = records.pop('schema_migration')
+        storage_ids = dict(zip(records, self.storage.store_analyses_bulk(list(records.values()))))
+        storage_ids['schema_migration'] = self.file_storage.store_analysis(**migration_record)
+        print(f"    ✓ Stored {len(storage_ids)} analyses", file=self._log)
+        self._flush_log()
+        return storage_ids
+        
+    def _flush_log(self):
+        """Write the buffered test output to stdout in one call"""
+        sys.stdout.write(self._log.getvalue())
+        self._log.seek(0)
+        self._log.truncate()
+        
+    def close(self):
+        """Release the shared storage and its temporary directory"""
+        # Output of a test that raised is still in the buffer
+        self._flush_log()
+        for storage in (self.storage, self.file_storage):
+            storage.session.close()
+            storage.engine.dispose()
+        self._temp_dir.cleanup()
+        
     def run_all_tests(self):
         """Run all storage validation tests"""
         print("=" * 80)
         print("SIMPLE STORAGE VALIDATION TEST SUITE")
         print("=" * 80)
         
-        # Run test categories
-        self.test_storage_validation()
-        self.test_data_retrieval()
-        self.test_metrics_validation()
-        self.test_schema_migration()
-        
-        # Generate test report
-        return self.generate_test_report()
+        try:
+            storage_ids = self._store_test_analyses()
+            
+            # Run test categories
+            self.test_storage_validation(storage_ids['storage_validation'])
+            self.test_data_retrieval(storage_ids['data_retrieval'])
+            self.test_metrics_validation(storage_ids['metrics_validation'])
+            self.test_schema_migration(storage_ids['schema_migration'])
+            
+            # Generate test report
+            return self.generate_test_report()
+        finally:
+            self.close()
         
-    def test_storage_validation(self):
+    def test_storage_validation(self, storage_id):
         """Test profiling data storage validation"""
-        print("\n" + "=" * 60)
-        print("1. STORAGE VALIDATION TEST")
-        print("=" * 60)
+        print("\n" + "=" * 60, file=self._log)
+        print("1. STORAGE VALIDATION TEST", file=self._log)
+        print("=" * 60, file=self._log)
         
         storage_test = {
             'profiling_data_storage': {
@@ -65,169 +209,83 @@ class SimpleStorageValidationTest:
             }
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test codebase
-            codebase_dir = os.path.join(temp_dir, "test_codebase")
-            os.makedirs(codebase_dir)
-            
-            # Create test script
-            script_path = os.path.join(codebase_dir, "test.py")
-            with open(script_path, "w") as f:
-                f.write('''def calculate_sum(n):
-    total = 0
-    for i in range(n):
-        total += i
-    return total
-
-result = calculate_sum(100)
-print(f"Sum: {result}")''')
-            
-            print(f"\n  Created test script at: {script_path}")
-            
-            # Run individual profiling methods
-            print(f"\n  Running individual profiling methods...")
-            
-            analyzer = DynamicAnalyzer()
-            
-            # Run Scalene profiling
-            scalene_result = analyzer.profile_with_scalene(script_path)
-            print(f"    ✓ Scalene profiling completed")
-            
-            # Run VizTracer tracing
-            viztracer_result = analyzer.trace_with_viztracer(script_path)
-            print(f"    ✓ VizTracer tracing completed")
-            
-            # Create a mock analysis result with profiling data
-            analysis_result = {
-                'analysis_results': {
-                    'test.py': {
-                        'scalene_profiling': scalene_result,
-                        'viztracer_tracing': viztracer_result
-                    }
-                },
-                'execution_coverage': {
-                    'scripts_discovered': 1,
-                    'scripts_analyzed': 1,
-                    'scripts_skipped': 0,
-                    'method_coverage': {
-                        'scalene_profiling': 1,
-                        'viztracer_tracing': 1
-                    }
-                },
-                'method_coverage_percentage': 100.0,
-                'execution_failures': [],
-                'failure_count': 0,
-                'issue_count': 0,
-                'analysis_completeness': {
-                    'status': 'complete',
-                    'coverage_metrics': {
-                        'overall_coverage': 100.0,
-                        'completeness_context': 'Test analysis completed successfully'
-                    }
-                }
+        storage = self.storage
+        
+        # Verify database record creation
+        print(f"\n  Verifying database record...", file=self._log)
+        
+        record = storage.session.get(AnalysisResult, storage_id)
+        
+        if record:
+            storage_test['profiling_data_storage']['success'] = True
+            storage_test['profiling_data_storage']['details'] = {
+                'record_id': record.id,
+                'has_scalene_data': bool(record.has_scalene_data),
+                'has_viztracer_data': bool(record.has_viztracer_data),
+                'scalene_coverage': record.scalene_coverage,
+                'viztracer_coverage': record.viztracer_coverage,
+                'peak_memory_usage': record.peak_memory_usage,
+                'cpu_hotspot_count': record.cpu_hotspot_count,
+                'function_call_count': record.function_call_count,
+                'exception_count': record.exception_count
             }
             
-            # Store analysis in database
-            print(f"\n  Storing analysis in database...")
-            
-            storage = AnalysisStorage(temp_dir)
-            storage_id = storage.store_analysis(
-                codebase_path=codebase_dir,
-                analysis_type="dynamic",
-                results=analysis_result,
-                summary="Simple storage validation test analysis"
-            )
-            
-            # Verify database record creation
-            print(f"\n  Verifying database record...")
-            
-            record = storage.session.query(AnalysisResult).filter(
-                AnalysisResult.id == storage_id
-            ).first()
-            
-            if record:
-                storage_test['profiling_data_storage']['success'] = True
-                storage_test['profiling_data_storage']['details'] = {
-                    'record_id': record.id,
-                    'has_scalene_data': bool(record.has_scalene_data),
-                    'has_viztracer_data': bool(record.has_viztracer_data),
-                    'scalene_coverage': record.scalene_coverage,
-                    'viztracer_coverage': record.viztracer_coverage,
-                    'peak_memory_usage': record.peak_memory_usage,
-                    'cpu_hotspot_count': record.cpu_hotspot_count,
-                    'function_call_count': record.function_call_count,
-                    'exception_count': record.exception_count
-                }
-                
-                print(f"    ✓ Database record created successfully")
-                print(f"    ✓ Record ID: {record.id}")
-                print(f"    ✓ Scalene data stored: {bool(record.has_scalene_data)}")
-                print(f"    ✓ VizTracer data stored: {bool(record.has_viztracer_data)}")
-                print(f"    ✓ Scalene coverage: {record.scalene_coverage:.2f}%")
-                print(f"    ✓ VizTracer coverage: {record.viztracer_coverage:.2f}%")
-                print(f"    ✓ Peak memory usage: {record.peak_memory_usage:.2f} MB")
-                print(f"    ✓ CPU hotspots: {record.cpu_hotspot_count}")
-                print(f"    ✓ Function calls: {record.function_call_count}")
-                print(f"    ✓ Exceptions traced: {record.exception_count}")
-            else:
-                print(f"    ✗ Failed to create database record")
-            
-            # Test database integrity
-            print(f"\n  Testing database integrity...")
-            
-            # Check if all required columns exist
-            from sqlalchemy import inspect
-            inspector = inspect(storage.engine)
-            columns = inspector.get_columns('analysis_results')
-            column_names = {col['name'] for col in columns}
-            
-            required_profiling_columns = [
-                'scalene_cpu_data', 'scalene_memory_data', 'scalene_gpu_data',
-                'viztracer_call_data', 'viztracer_exception_data', 'viztracer_flow_data',
-                'scalene_timestamp', 'viztracer_timestamp',
-                'has_scalene_data', 'has_viztracer_data',
-                'scalene_coverage', 'viztracer_coverage',
-                'peak_memory_usage', 'cpu_hotspot_count',
-                'function_call_count', 'exception_count'
-            ]
-            
-            missing_columns = [col for col in required_profiling_columns if col not in column_names]
-            
-            if not missing_columns:
-                storage_test['database_integrity']['success'] = True
-                storage_test['database_integrity']['details'] = {
-                    'total_columns': len(columns),
-                    'profiling_columns_present': len(required_profiling_columns),
-                    'missing_columns': []
-                }
-                print(f"    ✓ Database integrity verified")
-                print(f"    ✓ All required profiling columns present")
-                print(f"    ✓ Total columns: {len(columns)}")
-            else:
-                storage_test['database_integrity']['details'] = {
-                    'missing_columns': missing_columns
-                }
-                print(f"    ✗ Missing columns: {missing_columns}")
-            
-            # Close storage
-            storage.session.close()
-            storage.engine.dispose()
-            
+            print(f"    ✓ Database record created successfully", file=self._log)
+            print(f"    ✓ Record ID: {record.id}", file=self._log)
+            print(f"    ✓ Scalene data stored: {bool(record.has_scalene_data)}", file=self._log)
+            print(f"    ✓ VizTracer data stored: {bool(record.has_viztracer_data)}", file=self._log)
+            print(f"    ✓ Scalene coverage: {record.scalene_coverage:.2f}%", file=self._log)
+            print(f"    ✓ VizTracer coverage: {record.viztracer_coverage:.2f}%", file=self._log)
+            print(f"    ✓ Peak memory usage: {record.peak_memory_usage:.2f} MB", file=self._log)
+            print(f"    ✓ CPU hotspots: {record.cpu_hotspot_count}", file=self._log)
+            print(f"    ✓ Function calls: {record.function_call_count}", file=self._log)
+            print(f"    ✓ Exceptions traced: {record.exception_count}", file=self._log)
+        else:
+            print(f"    ✗ Failed to create database record", file=self._log)
+        
+        # Test database integrity
+        print(f"\n  Testing database integrity...", file=self._log)
+        
+        # Check if all required columns exist
+        # Reflect the live schema; the ORM model would only ever agree with itself
+        columns = inspect(storage.engine).get_columns('analysis_results')
+        column_names = {col['name'] for col in columns}
+        
+        missing_columns = sorted(_REQUIRED_PROFILING_COLUMNS - column_names)
+        
+        if not missing_columns:
+            storage_test['database_integrity']['success'] = True
+            storage_test['database_integrity']['details'] = {
+                'total_columns': len(columns),
+                'profiling_columns_present': len(_REQUIRED_PROFILING_COLUMNS),
+                'missing_columns': []
+            }
+            print(f"    ✓ Database integrity verified", file=self._log)
+            print(f"    ✓ All required profiling columns present", file=self._log)
+            print(f"    ✓ Total columns: {len(columns)}", file=self._log)
+        else:
+            storage_test['database_integrity']['details'] = {
+                'missing_columns': missing_columns
+            }
+            print(f"    ✗ Missing columns: {missing_columns}", file=self._log)
+        
         self.test_results['storage_validation'].append(storage_test)
         
         if all([
             storage_test['profiling_data_storage']['success'],
             storage_test['database_integrity']['success']
         ]):
-            print(f"\n  ✓ Storage validation test: PASSED")
+            print(f"\n  ✓ Storage validation test: PASSED", file=self._log)
         else:
-            print(f"\n  ✗ Storage validation test: FAILED")
+            print(f"\n  ✗ Storage validation test: FAILED", file=self._log)
         
-    def test_data_retrieval(self):
+        self._flush_log()
+        
+    def test_data_retrieval(self, storage_id):
         """Test data retrieval and query functionality"""
-        print("\n" + "=" * 60)
-        print("2. DATA RETRIEVAL TEST")
-        print("=" * 60)
+        print("\n" + "=" * 60, file=self._log)
+        print("2. DATA RETRIEVAL TEST", file=self._log)
+        print("=" * 60, file=self._log)
         
         retrieval_test = {
             'basic_retrieval': {
@@ -244,127 +302,70 @@ print(f"Sum: {result}")''')
             }
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test codebase
-            codebase_dir = os.path.join(temp_dir, "test_codebase")
-            os.makedirs(codebase_dir)
-            
-            script_path = os.path.join(codebase_dir, "test.py")
-            with open(script_path, "w") as f:
-                f.write('''def test_function():
-    print("Testing retrieval")
-    return 42
-
-result = test_function()
-print(f"Result: {result}")''')
-            
-            # Run profiling and create analysis result
-            analyzer = DynamicAnalyzer()
-            scalene_result = analyzer.profile_with_scalene(script_path)
-            viztracer_result = analyzer.trace_with_viztracer(script_path)
+        storage = self.storage
+        codebase_dir = self._codebase_dir('data_retrieval')
+        
+        # Test 1: Basic data retrieval
+        print(f"\n  Testing basic data retrieval...", file=self._log)
+        
+        record = storage.session.get(AnalysisResult, storage_id)
+        
+        if record:
+            # Retrieve profiling data
+            scalene_data = record.scalene_cpu_data or record.scalene_memory_data
+            viztracer_data = record.viztracer_call_data or record.viztracer_exception_data
             
-            analysis_result = {
-                'analysis_results': {
-                    'test.py': {
-                        'scalene_profiling': scalene_result,
-                        'viztracer_tracing': viztracer_result
-                    }
-                },
-                'execution_coverage': {
-                    'scripts_discovered': 1,
-                    'scripts_analyzed': 1,
-                    'scripts_skipped': 0,
-                    'method_coverage': {
-                        'scalene_profiling': 1,
-                        'viztracer_tracing': 1
-                    }
-                },
-                'method_coverage_percentage': 100.0,
-                'execution_failures': [],
-                'failure_count': 0,
-                'issue_count': 0,
-                'analysis_completeness': {
-                    'status': 'complete',
-                    'coverage_metrics': {
-                        'overall_coverage': 100.0,
-                        'completeness_context': 'Test analysis completed successfully'
-                    }
+            if scalene_data or viztracer_data:
+                retrieval_test['basic_retrieval']['success'] = True
+                retrieval_test['basic_retrieval']['details'] = {
+                    'scalene_data_retrieved': bool(scalene_data),
+                    'viztracer_data_retrieved': bool(viztracer_data),
+                    'full_results_available': bool(record.full_results),
+                    'metrics_available': bool(record.metrics)
                 }
-            }
-            
-            storage = AnalysisStorage(temp_dir)
-            storage_id = storage.store_analysis(
-                codebase_path=codebase_dir,
-                analysis_type="dynamic",
-                results=analysis_result,
-                summary="Data retrieval test"
-            )
-            
-            # Test 1: Basic data retrieval
-            print(f"\n  Testing basic data retrieval...")
-            
-            record = storage.session.query(AnalysisResult).filter(
-                AnalysisResult.id == storage_id
-            ).first()
-            
-            if record:
-                # Retrieve profiling data
-                scalene_data = record.scalene_cpu_data or record.scalene_memory_data
-                viztracer_data = record.viztracer_call_data or record.viztracer_exception_data
                 
-                if scalene_data or viztracer_data:
-                    retrieval_test['basic_retrieval']['success'] = True
-                    retrieval_test['basic_retrieval']['details'] = {
-                        'scalene_data_retrieved': bool(scalene_data),
-                        'viztracer_data_retrieved': bool(viztracer_data),
-                        'full_results_available': bool(record.full_results),
-                        'metrics_available': bool(record.metrics)
-                    }
-                    
-                    print(f"    ✓ Profiling data retrieved successfully")
-                    print(f"    ✓ Scalene data: {bool(scalene_data)}")
-                    print(f"    ✓ VizTracer data: {bool(viztracer_data)}")
-                    print(f"    ✓ Full results available: {bool(record.full_results)}")
-                    print(f"    ✓ Metrics available: {bool(record.metrics)}")
-                else:
-                    print(f"    ✗ Profiling data not found in record")
-            
-            # Test 2: Query functionality
-            print(f"\n  Testing query functionality...")
-            
-            # Query by codebase path
-            records_by_codebase = storage.session.query(AnalysisResult).filter(
-                AnalysisResult.codebase_path == codebase_dir
-            ).all()
-            
-            if records_by_codebase:
-                retrieval_test['query_functionality']['success'] = True
-                retrieval_test['query_functionality']['details'] = {
-                    'records_found': len(records_by_codebase),
-                    'query_type': 'codebase_path'
-                }
-                print(f"    ✓ Query by codebase path successful")
-                print(f"    ✓ Records found: {len(records_by_codebase)}")
-            
-            # Test 3: Execution logs retrieval
-            print(f"\n  Testing execution logs retrieval...")
-            
-            execution_logs = storage.get_execution_logs(storage_id)
-            
-            if execution_logs is not None:
-                retrieval_test['execution_logs']['success'] = True
-                retrieval_test['execution_logs']['details'] = {
-                    'log_count': len(execution_logs),
-                    'has_error_logs': any(log['log_level'] in ['ERROR', 'CRITICAL'] for log in execution_logs)
-                }
-                print(f"    ✓ Execution logs retrieved successfully")
-                print(f"    ✓ Log count: {len(execution_logs)}")
-                print(f"    ✓ Has error logs: {any(log['log_level'] in ['ERROR', 'CRITICAL'] for log in execution_logs)}")
-            
-            # Close storage
-            storage.session.close()
-            storage.engine.dispose()
-            
+                print(f"    ✓ Profiling data retrieved successfully", file=self._log)
+                print(f"    ✓ Scalene data: {bool(scalene_data)}", file=self._log)
+                print(f"    ✓ VizTracer data: {bool(viztracer_data)}", file=self._log)
+                print(f"    ✓ Full results available: {bool(record.full_results)}", file=self._log)
+                print(f"    ✓ Metrics available: {bool(record.metrics)}", file=self._log)
+            else:
+                print(f"    ✗ Profiling data not found in record", file=self._log)
+        
+        # Test 2: Query functionality
+        print(f"\n  Testing query functionality...", file=self._log)
+        
+        # Query by codebase path
+        records_found = storage.session.execute(
+            select(func.count()).select_from(AnalysisResult).where(AnalysisResult.codebase_path == codebase_dir)
+        ).scalar()
+        
+        if records_found:
+            retrieval_test['query_functionality']['success'] = True
+            retrieval_test['query_functionality']['details'] = {
+                'records_found': records_found,
+                'query_type': 'codebase_path'
+            }
+            print(f"    ✓ Query by codebase path successful", file=self._log)
+            print(f"    ✓ Records found: {records_found}", file=self._log)
+        
+        # Test 3: Execution logs retrieval
+        print(f"\n  Testing execution logs retrieval...", file=self._log)
+        
+        execution_logs = storage.get_execution_logs(storage_id)
+        
+        if execution_logs is not None:
+            log_count = len(execution_logs)
+            has_error_logs = any(log['log_level'] in _ERROR_LEVELS for log in execution_logs)
+            retrieval_test['execution_logs']['success'] = True
+            retrieval_test['execution_logs']['details'] = {
+                'log_count': log_count,
+                'has_error_logs': has_error_logs
+            }
+            print(f"    ✓ Execution logs retrieved successfully", file=self._log)
+            print(f"    ✓ Log count: {log_count}", file=self._log)
+            print(f"    ✓ Has error logs: {has_error_logs}", file=self._log)
+        
         self.test_results['data_retrieval'].append(retrieval_test)
         
         if all([
@@ -372,15 +373,17 @@ print(f"Result: {result}")''')
             retrieval_test['query_functionality']['success'],
             retrieval_test['execution_logs']['success']
         ]):
-            print(f"\n  ✓ Data retrieval test: PASSED")
+            print(f"\n  ✓ Data retrieval test: PASSED", file=self._log)
         else:
-            print(f"\n  ✗ Data retrieval test: FAILED")
+            print(f"\n  ✗ Data retrieval test: FAILED", file=self._log)
+        
+        self._flush_log()
         
-    def test_metrics_validation(self):
+    def test_metrics_validation(self, storage_id):
         """Test metrics calculation including profiling data"""
-        print("\n" + "=" * 60)
-        print("3. METRICS VALIDATION TEST")
-        print("=" * 60)
+        print("\n" + "=" * 60, file=self._log)
+        print("3. METRICS VALIDATION TEST", file=self._log)
+        print("=" * 60, file=self._log)
         
         metrics_test = {
             'profiling_metrics_inclusion': {
@@ -397,149 +400,89 @@ print(f"Result: {result}")''')
             }
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test codebase
-            codebase_dir = os.path.join(temp_dir, "test_codebase")
-            os.makedirs(codebase_dir)
-            
-            script_path = os.path.join(codebase_dir, "test.py")
-            with open(script_path, "w") as f:
-                f.write('''def calculate_factorial(n):
-    if n <= 1:
-        return 1
-    return n * calculate_factorial(n - 1)
-
-result = calculate_factorial(5)
-print(f"Factorial: {result}")''')
-            
-            # Run profiling and create analysis result
-            analyzer = DynamicAnalyzer()
-            scalene_result = analyzer.profile_with_scalene(script_path)
-            viztracer_result = analyzer.trace_with_viztracer(script_path)
-            
-            analysis_result = {
-                'analysis_results': {
-                    'test.py': {
-                        'scalene_profiling': scalene_result,
-                        'viztracer_tracing': viztracer_result
-                    }
-                },
-                'execution_coverage': {
-                    'scripts_discovered': 1,
-                    'scripts_analyzed': 1,
-                    'scripts_skipped': 0,
-                    'method_coverage': {
-                        'scalene_profiling': 1,
-                        'viztracer_tracing': 1
-                    }
-                },
-                'method_coverage_percentage': 100.0,
-                'execution_failures': [],
-                'failure_count': 0,
-                'issue_count': 0,
-                'analysis_completeness': {
-                    'status': 'complete',
-                    'coverage_metrics': {
-                        'overall_coverage': 100.0,
-                        'completeness_context': 'Test analysis completed successfully'
-                    }
+        storage = self.storage
+        
+        # Test 1: Profiling metrics inclusion
+        print(f"\n  Testing profiling metrics inclusion...", file=self._log)
+        
+        record = storage.session.get(AnalysisResult, storage_id)
+        
+        if record and record.metrics:
+            metrics = record.metrics
+            
+            # Classify Scalene and VizTracer metrics in a single pass
+            has_scalene_metrics = has_viztracer_metrics = False
+            profiling_metrics = {}
+            for key, value in metrics.items():
+                key_lower = key.lower()
+                in_scalene = 'scalene' in key_lower
+                in_viztracer = 'viztracer' in key_lower
+                has_scalene_metrics |= in_scalene or key.startswith(('cpu_', 'memory_'))
+                has_viztracer_metrics |= in_viztracer or key.startswith(('function_', 'trace_'))
+                if in_scalene or in_viztracer:
+                    profiling_metrics[key] = value
+            
+            if has_scalene_metrics or has_viztracer_metrics:
+                metrics_test['profiling_metrics_inclusion']['success'] = True
+                metrics_test['profiling_metrics_inclusion']['details'] = {
+                    'has_scalene_metrics': has_scalene_metrics,
+                    'has_viztracer_metrics': has_viztracer_metrics,
+                    'total_metrics': len(metrics),
+                    'profiling_metric_count': len(profiling_metrics)
                 }
-            }
-            
-            storage = AnalysisStorage(temp_dir)
-            storage_id = storage.store_analysis(
-                codebase_path=codebase_dir,
-                analysis_type="dynamic",
-                results=analysis_result,
-                summary="Metrics validation test"
-            )
-            
-            # Test 1: Profiling metrics inclusion
-            print(f"\n  Testing profiling metrics inclusion...")
-            
-            record = storage.session.query(AnalysisResult).filter(
-                AnalysisResult.id == storage_id
-            ).first()
-            
-            if record and record.metrics:
-                metrics = record.metrics
                 
-                # Check for Scalene metrics
-                has_scalene_metrics = any(key.startswith('cpu_') or key.startswith('memory_') 
-                                        or 'scalene' in key.lower() for key in metrics)
+                print(f"    ✓ Profiling metrics included in calculation", file=self._log)
+                print(f"    ✓ Scalene metrics: {has_scalene_metrics}", file=self._log)
+                print(f"    ✓ VizTracer metrics: {has_viztracer_metrics}", file=self._log)
+                print(f"    ✓ Total metrics: {len(metrics)}", file=self._log)
+                print(f"    ✓ Profiling metrics: {len(profiling_metrics)}", file=self._log)
                 
-                # Check for VizTracer metrics
-                has_viztracer_metrics = any(key.startswith('function_') or key.startswith('trace_')
-                                         or 'viztracer' in key.lower() for key in metrics)
-                
-                if has_scalene_metrics or has_viztracer_metrics:
-                    metrics_test['profiling_metrics_inclusion']['success'] = True
-                    metrics_test['profiling_metrics_inclusion']['details'] = {
-                        'has_scalene_metrics': has_scalene_metrics,
-                        'has_viztracer_metrics': has_viztracer_metrics,
-                        'total_metrics': len(metrics),
-                        'profiling_metric_count': len([k for k in metrics.keys() 
-                                                     if 'scalene' in k.lower() or 'viztracer' in k.lower()])
-                    }
-                    
-                    print(f"    ✓ Profiling metrics included in calculation")
-                    print(f"    ✓ Scalene metrics: {has_scalene_metrics}")
-                    print(f"    ✓ VizTracer metrics: {has_viztracer_metrics}")
-                    print(f"    ✓ Total metrics: {len(metrics)}")
-                    print(f"    ✓ Profiling metrics: {len([k for k in metrics.keys() if 'scalene' in k.lower() or 'viztracer' in k.lower()])}")
-                    
-                    # Show specific profiling metrics
-                    profiling_metrics = {k: v for k, v in metrics.items() 
-                                       if 'scalene' in k.lower() or 'viztracer' in k.lower()}
-                    for metric_name, metric_value in profiling_metrics.items():
-                        print(f"    ✓ {metric_name}: {metric_value}")
-            
-            # Test 2: Quality score calculation
-            print(f"\n  Testing quality score calculation...")
-            
-            if record:
-                quality_score = record.quality_score
+                # Show specific profiling metrics
+                for metric_name, metric_value in profiling_metrics.items():
+                    print(f"    ✓ {metric_name}: {metric_value}", file=self._log)
+        
+        # Test 2: Quality score calculation
+        print(f"\n  Testing quality score calculation...", file=self._log)
+        
+        if record:
+            quality_score = record.quality_score
+            
+            # Check if quality score is reasonable (0-100)
+            if 0 <= quality_score <= 100:
+                metrics_test['quality_score_calculation']['success'] = True
+                metrics_test['quality_score_calculation']['details'] = {
+                    'quality_score': quality_score,
+                    'issue_count': record.issue_count,
+                    'complexity_score': record.complexity_score
+                }
                 
-                # Check if quality score is reasonable (0-100)
-                if 0 <= quality_score <= 100:
-                    metrics_test['quality_score_calculation']['success'] = True
-                    metrics_test['quality_score_calculation']['details'] = {
-                        'quality_score': quality_score,
-                        'issue_count': record.issue_count,
-                        'complexity_score': record.complexity_score
-                    }
-                    
-                    print(f"    ✓ Quality score calculated: {quality_score}")
-                    print(f"    ✓ Issue count: {record.issue_count}")
-                    print(f"    ✓ Complexity score: {record.complexity_score}")
-                else:
-                    print(f"    ✗ Invalid quality score: {quality_score}")
-            
-            # Test 3: Completeness metrics
-            print(f"\n  Testing completeness metrics...")
+                print(f"    ✓ Quality score calculated: {quality_score}", file=self._log)
+                print(f"    ✓ Issue count: {record.issue_count}", file=self._log)
+                print(f"    ✓ Complexity score: {record.complexity_score}", file=self._log)
+            else:
+                print(f"    ✗ Invalid quality score: {quality_score}", file=self._log)
+        
+        # Test 3: Completeness metrics
+        print(f"\n  Testing completeness metrics...", file=self._log)
+        
+        if record:
+            coverage_percentage = record.coverage_percentage
+            completeness_context = record.completeness_context
             
-            if record:
-                coverage_percentage = record.coverage_percentage
-                completeness_context = record.completeness_context
+            if coverage_percentage >= 0 and coverage_percentage <= 100:
+                metrics_test['completeness_metrics']['success'] = True
+                metrics_test['completeness_metrics']['details'] = {
+                    'coverage_percentage': coverage_percentage,
+                    'completeness_context': completeness_context,
+                    'analysis_status': record.analysis_status
+                }
                 
-                if coverage_percentage >= 0 and coverage_percentage <= 100:
-                    metrics_test['completeness_metrics']['success'] = True
-                    metrics_test['completeness_metrics']['details'] = {
-                        'coverage_percentage': coverage_percentage,
-                        'completeness_context': completeness_context,
-                        'analysis_status': record.analysis_status
-                    }
-                    
-                    print(f"    ✓ Completeness metrics valid")
-                    print(f"    ✓ Coverage percentage: {coverage_percentage:.2f}%")
-                    print(f"    ✓ Analysis status: {record.analysis_status}")
-                    if completeness_context:
-                        print(f"    ✓ Completeness context: {completeness_context[:100]}...")
-            
-            # Close storage
-            storage.session.close()
-            storage.engine.dispose()
-            
+                print(f"    ✓ Completeness metrics valid", file=self._log)
+                print(f"    ✓ Coverage percentage: {coverage_percentage:.2f}%", file=self._log)
+                print(f"    ✓ Analysis status: {record.analysis_status}", file=self._log)
+                if completeness_context:
+                    print(f"    ✓ Completeness context: {completeness_context[:100]}...", file=self._log)
+        
         self.test_results['metrics_validation'].append(metrics_test)
         
         if all([
@@ -547,15 +490,17 @@ print(f"Factorial: {result}")''')
             metrics_test['quality_score_calculation']['success'],
             metrics_test['completeness_metrics']['success']
         ]):
-            print(f"\n  ✓ Metrics validation test: PASSED")
+            print(f"\n  ✓ Metrics validation test: PASSED", file=self._log)
         else:
-            print(f"\n  ✗ Metrics validation test: FAILED")
+            print(f"\n  ✗ Metrics validation test: FAILED", file=self._log)
         
-    def test_schema_migration(self):
+        self._flush_log()
+        
+    def test_schema_migration(self, storage_id):
         """Test storage schema migration functionality"""
-        print("\n" + "=" * 60)
-        print("4. SCHEMA MIGRATION TEST")
-        print("=" * 60)
+        print("\n" + "=" * 60, file=self._log)
+        print("4. SCHEMA MIGRATION TEST", file=self._log)
+        print("=" * 60, file=self._log)
         
         migration_test = {
             'schema_migration': {
@@ -572,136 +517,80 @@ print(f"Factorial: {result}")''')
             }
         }
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test codebase
-            codebase_dir = os.path.join(temp_dir, "test_codebase")
-            os.makedirs(codebase_dir)
-            
-            script_path = os.path.join(codebase_dir, "test.py")
-            with open(script_path, "w") as f:
-                f.write('print("Schema migration test")')
-            
-            # Test 1: Schema migration
-            print(f"\n  Testing schema migration...")
-            
-            # Create storage instance (this will trigger migration if needed)
-            storage = AnalysisStorage(temp_dir)
-            
-            # Check migration status
-            migration_status = storage._get_migration_status()
-            
-            if migration_status.get('compatible', False):
-                migration_test['schema_migration']['success'] = True
-                migration_test['schema_migration']['details'] = {
-                    'database_exists': migration_status.get('database_exists', False),
-                    'compatible': migration_status.get('compatible', False),
-                    'version': migration_status.get('version', 0),
-                    'has_profiling_columns': migration_status.get('has_profiling_columns', False)
-                }
-                
-                print(f"    ✓ Schema migration successful")
-                print(f"    ✓ Database compatible: {migration_status.get('compatible', False)}")
-                print(f"    ✓ Database version: {migration_status.get('version', 0)}")
-                print(f"    ✓ Has profiling columns: {migration_status.get('has_profiling_columns', False)}")
-            else:
-                print(f"    ✗ Schema migration failed")
-            
-            # Test 2: Backward compatibility
-            print(f"\n  Testing backward compatibility...")
-            
-            # Run profiling and create analysis result
-            analyzer = DynamicAnalyzer()
-            scalene_result = analyzer.profile_with_scalene(script_path)
-            viztracer_result = analyzer.trace_with_viztracer(script_path)
-            
-            analysis_result = {
-                'analysis_results': {
-                    'test.py': {
-                        'scalene_profiling': scalene_result,
-                        'viztracer_tracing': viztracer_result
-                    }
-                },
-                'execution_coverage': {
-                    'scripts_discovered': 1,
-                    'scripts_analyzed': 1,
-                    'scripts_skipped': 0,
-                    'method_coverage': {
-                        'scalene_profiling': 1,
-                        'viztracer_tracing': 1
-                    }
-                },
-                'method_coverage_percentage': 100.0,
-                'execution_failures': [],
-                'failure_count': 0,
-                'issue_count': 0,
-                'analysis_completeness': {
-                    'status': 'complete',
-                    'coverage_metrics': {
-                        'overall_coverage': 100.0,
-                        'completeness_context': 'Test analysis completed successfully'
-                    }
-                }
+        # Test 1: Schema migration
+        print(f"\n  Testing schema migration...", file=self._log)
+        
+        # File-backed storage instance (creating it triggered migration if needed)
+        storage = self.file_storage
+        
+        # Check migration status
+        migration_status = storage._get_migration_status()
+        
+        if migration_status.get('compatible', False):
+            migration_test['schema_migration']['success'] = True
+            migration_test['schema_migration']['details'] = {
+                'database_exists': migration_status.get('database_exists', False),
+                'compatible': migration_status.get('compatible', False),
+                'version': migration_status.get('version', 0),
+                'has_profiling_columns': migration_status.get('has_profiling_columns', False)
             }
             
-            storage_id = storage.store_analysis(
-                codebase_path=codebase_dir,
-                analysis_type="dynamic",
-                results=analysis_result,
-                summary="Schema migration test"
-            )
+            print(f"    ✓ Schema migration successful", file=self._log)
+            print(f"    ✓ Database compatible: {migration_status.get('compatible', False)}", file=self._log)
+            print(f"    ✓ Database version: {migration_status.get('version', 0)}", file=self._log)
+            print(f"    ✓ Has profiling columns: {migration_status.get('has_profiling_columns', False)}", file=self._log)
+        else:
+            print(f"    ✗ Schema migration failed", file=self._log)
+        
+        # Test 2: Backward compatibility
+        print(f"\n  Testing backward compatibility...", file=self._log)
+        
+        # Verify the record stored up front can be retrieved
+        record = storage.session.get(AnalysisResult, storage_id)
+        
+        if record:
+            migration_test['backward_compatibility']['success'] = True
+            migration_test['backward_compatibility']['details'] = {
+                'record_id': record.id,
+                'can_retrieve': True,
+                'has_required_fields': all([
+                    hasattr(record, 'codebase_path'),
+                    hasattr(record, 'analysis_type'),
+                    hasattr(record, 'timestamp'),
+                    hasattr(record, 'summary')
+                ])
+            }
             
-            # Verify record can be retrieved
-            record = storage.session.query(AnalysisResult).filter(
-                AnalysisResult.id == storage_id
-            ).first()
+            print(f"    ✓ Backward compatibility maintained", file=self._log)
+            print(f"    ✓ Record retrieval successful", file=self._log)
+            print(f"    ✓ All required fields present", file=self._log)
+        
+        # Test 3: Database versioning
+        print(f"\n  Testing database versioning...", file=self._log)
+        
+        # Check if version table exists and can be queried
+        try:
+            from sqlalchemy import inspect
+            inspector = inspect(storage.engine)
             
-            if record:
-                migration_test['backward_compatibility']['success'] = True
-                migration_test['backward_compatibility']['details'] = {
-                    'record_id': record.id,
-                    'can_retrieve': True,
-                    'has_required_fields': all([
-                        hasattr(record, 'codebase_path'),
-                        hasattr(record, 'analysis_type'),
-                        hasattr(record, 'timestamp'),
-                        hasattr(record, 'summary')
-                    ])
+            if inspector.has_table('database_version'):
+                version = storage._get_database_version()
+                
+                migration_test['database_versioning']['success'] = True
+                migration_test['database_versioning']['details'] = {
+                    'version_table_exists': True,
+                    'current_version': version
                 }
                 
-                print(f"    ✓ Backward compatibility maintained")
-                print(f"    ✓ Record retrieval successful")
-                print(f"    ✓ All required fields present")
-            
-            # Test 3: Database versioning
-            print(f"\n  Testing database versioning...")
-            
-            # Check if version table exists and can be queried
-            try:
-                from sqlalchemy import inspect
-                inspector = inspect(storage.engine)
+                print(f"    ✓ Database versioning working", file=self._log)
+                print(f"    ✓ Version table exists", file=self._log)
+                print(f"    ✓ Current version: {version}", file=self._log)
+            else:
+                print(f"    ✗ Version table not found", file=self._log)
                 
-                if inspector.has_table('database_version'):
-                    version = storage._get_database_version()
-                    
-                    migration_test['database_versioning']['success'] = True
-                    migration_test['database_versioning']['details'] = {
-                        'version_table_exists': True,
-                        'current_version': version
-                    }
-                    
-                    print(f"    ✓ Database versioning working")
-                    print(f"    ✓ Version table exists")
-                    print(f"    ✓ Current version: {version}")
-                else:
-                    print(f"    ✗ Version table not found")
-                    
-            except Exception as e:
-                print(f"    ✗ Database versioning check failed: {e}")
-            
-            # Close storage
-            storage.session.close()
-            storage.engine.dispose()
-            
+        except Exception as e:
+            print(f"    ✗ Database versioning check failed: {e}", file=self._log)
+        
         self.test_results['schema_migration'].append(migration_test)
         
         if all([
@@ -709,95 +598,86 @@ print(f"Factorial: {result}")''')
             migration_test['backward_compatibility']['success'],
             migration_test['database_versioning']['success']
         ]):
-            print(f"\n  ✓ Schema migration test: PASSED")
+            print(f"\n  ✓ Schema migration test: PASSED", file=self._log)
         else:
-            print(f"\n  ✗ Schema migration test: FAILED")
+            print(f"\n  ✗ Schema migration test: FAILED", file=self._log)
+        
+        self._flush_log()
         
     def generate_test_report(self):
         """Generate comprehensive test report"""
-        print("\n" + "=" * 80)
-        print("SIMPLE STORAGE VALIDATION TEST REPORT")
-        print("=" * 80)
+        buf = []
+        buf.append("\n" + "=" * 80)
+        buf.append("SIMPLE STORAGE VALIDATION TEST REPORT")
+        buf.append("=" * 80)
         
-        # Calculate overall statistics
+        # Walk the results once, collecting overall totals, per-category counts and findings
         total_tests = 0
         passed_tests = 0
-        
-        for category, tests in self.test_results.items():
-            for test in tests:
-                if isinstance(test, dict):
-                    for test_name, test_data in test.items():
-                        total_tests += 1
-                        if test_data.get('success', False):
-                            passed_tests += 1
-        
-        execution_time = time.time() - self.start_time
-        
-        print(f"\nExecution Time: {execution_time:.2f} seconds")
-        print(f"Total Tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {total_tests - passed_tests}")
-        print(f"Success Rate: {(passed_tests / total_tests * 100):.1f}%" if total_tests > 0 else "0%")
-        
-        # Detailed category results
-        print(f"\n" + "-" * 80)
-        print("CATEGORY RESULTS:")
-        print("-" * 80)
-        
         category_results = {}
+        findings = {}
+        
         for category, tests in self.test_results.items():
-            category_passed = 0
-            category_total = 0
-            
-            for test in tests:
-                if isinstance(test, dict):
-                    for test_name, test_data in test.items():
-                        category_total += 1
-                        if test_data.get('success', False):
-                            category_passed += 1
+            category_findings = findings[category] = [
+                (test_name, test_data.get('success', False), test_data.get('details') or {})
+                for test in tests if isinstance(test, dict)
+                for test_name, test_data in test.items()
+            ]
+            # Count with len()/sum() rather than incrementing counters per test
+            category_total = len(category_findings)
+            category_passed = sum(1 for _, success, _ in category_findings if success)
             
             category_results[category] = {
                 'passed': category_passed,
                 'total': category_total,
                 'success_rate': (category_passed / category_total * 100) if category_total > 0 else 0
             }
+            total_tests += category_total
+            passed_tests += category_passed
+        
+        execution_time = time.time() - self.start_time
+        
+        buf.append(f"\nExecution Time: {execution_time:.2f} seconds")
+        buf.append(f"Total Tests: {total_tests}")
+        buf.append(f"Passed: {passed_tests}")
+        buf.append(f"Failed: {total_tests - passed_tests}")
+        buf.append(f"Success Rate: {(passed_tests / total_tests * 100):.1f}%" if total_tests > 0 else "0%")
+        
+        # Detailed category results
+        buf.append(f"\n" + "-" * 80)
+        buf.append("CATEGORY RESULTS:")
+        buf.append("-" * 80)
         
         for category, results in category_results.items():
             status = "PASSED" if results['success_rate'] >= 80 else "FAILED"
-            print(f"  {category.upper()}: {results['passed']}/{results['total']} ({results['success_rate']:.1f}%) - {status}")
+            buf.append(f"  {category.upper()}: {results['passed']}/{results['total']} ({results['success_rate']:.1f}%) - {status}")
         
         # Validation criteria summary
-        print(f"\n" + "-" * 80)
-        print("VALIDATION CRITERIA SUMMARY:")
-        print("-" * 80)
-        
-        validation_criteria = {
-            "✅ Profiling data is stored in database": category_results.get('storage_validation', {}).get('success_rate', 0) >= 80,
-            "✅ Data can be retrieved and queried correctly": category_results.get('data_retrieval', {}).get('success_rate', 0) >= 80,
-            "✅ Metrics calculation includes Scalene and VizTracer metrics": category_results.get('metrics_validation', {}).get('success_rate', 0) >= 80,
-            "✅ Storage schema migration works correctly": category_results.get('schema_migration', {}).get('success_rate', 0) >= 80
-        }
+        buf.append(f"\n" + "-" * 80)
+        buf.append("VALIDATION CRITERIA SUMMARY:")
+        buf.append("-" * 80)
+        
+        rates = {category: results['success_rate'] for category, results in category_results.items()}
+        validation_criteria = {label: rates.get(category, 0) >= 80 for label, category in _CRITERIA_KEYS}
         
         for criterion, passed in validation_criteria.items():
             status = "✓ PASS" if passed else "✗ FAIL"
-            print(f"  {status} {criterion}")
+            buf.append(f"  {status} {criterion}")
         
         # Detailed findings
-        print(f"\n" + "-" * 80)
-        print("DETAILED FINDINGS:")
-        print("-" * 80)
-        
-        for category, tests in self.test_results.items():
-            print(f"\n{category.upper()}: ")
-            for test in tests:
-                if isinstance(test, dict):
-                    for test_name, test_data in test.items():
-                        status = "✓ PASS" if test_data.get('success', False) else "✗ FAIL"
-                        print(f"  {test_name}: {status}")
-                        
-                        if not test_data.get('success', False) and test_data.get('details'):
-                            for detail_key, detail_value in test_data.get('details', {}).items():
-                                print(f"    - {detail_key}: {detail_value}")
+        buf.append(f"\n" + "-" * 80)
+        buf.append("DETAILED FINDINGS:")
+        buf.append("-" * 80)
+        
+        for category, category_findings in findings.items():
+            buf.append(f"\n{category.upper()}: ")
+            for test_name, success, details in category_findings:
+                status = "✓ PASS" if success else "✗ FAIL"
+                buf.append(f"  {test_name}: {status}")
+                
+                if not success:
+                    for detail_key, detail_value in details.items():
+                        buf.append(f"    - {detail_key}: {detail_value}")
         
         # Save detailed report
         report_data = {
@@ -812,34 +692,67 @@ print(f"Factorial: {result}")''')
             'validation_criteria': validation_criteria
         }
         
-        with open('simple_storage_validation_report.json', 'w') as f:
-            json.dump(report_data, f, indent=2)
+        dump_json(report_data, 'simple_storage_validation_report.json')
         
-        print(f"\n" + "=" * 80)
-        print("SIMPLE STORAGE VALIDATION REPORT SAVED TO: simple_storage_validation_report.json")
-        print("=" * 80)
+        buf.append(f"\n" + "=" * 80)
+        buf.append("SIMPLE STORAGE VALIDATION REPORT SAVED TO: simple_storage_validation_report.json")
+        buf.append("=" * 80)
         
         # Final summary
         overall_success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
-        print(f"\nFINAL SUMMARY:")
-        print(f"  ✓ Storage validation: {category_results.get('storage_validation', {}).get('success_rate', 0):.1f}%")
-        print(f"  ✓ Data retrieval: {category_results.get('data_retrieval', {}).get('success_rate', 0):.1f}%")
-        print(f"  ✓ Metrics validation: {category_results.get('metrics_validation', {}).get('success_rate', 0):.1f}%")
-        print(f"  ✓ Schema migration: {category_results.get('schema_migration', {}).get('success_rate', 0):.1f}%")
-        print(f"\n  OVERALL: {overall_success_rate:.1f}%")
+        buf.append(f"\nFINAL SUMMARY:")
+        buf.extend(f"  ✓ {category.replace('_', ' ').capitalize()}: {rates.get(category, 0):.1f}%" for category in _CATEGORIES)
+        buf.append(f"\n  OVERALL: {overall_success_rate:.1f}%")
         
         # Check validation criteria
         all_criteria_met = all(validation_criteria.values())
         
         if all_criteria_met:
-            print(f"\n🎉 SIMPLE STORAGE VALIDATION COMPLETED SUCCESSFULLY!")
-            print("All validation criteria met.")
-            return True
+            buf.append(f"\n🎉 SIMPLE STORAGE VALIDATION COMPLETED SUCCESSFULLY!")
+            buf.append("All validation criteria met.")
         else:
-            print(f"\n❌ SIMPLE STORAGE VALIDATION COMPLETED WITH ISSUES")
-            print("Some validation criteria not met. Review the detailed findings above.")
-            return False
+            buf.append(f"\n❌ SIMPLE STORAGE VALIDATION COMPLETED WITH ISSUES")
+            buf.append("Some validation criteria not met. Review the detailed findings above.")
+        sys.stdout.write("\n".join(buf) + "\n")
+        
+        return all_criteria_met
+
+# pytest entry points; each category is its own item so pytest-xdist can spread them across workers
+
+@pytest.fixture(scope="module")
+def storage_suite():
+    """Storage suite with every category's analysis profiled and stored up front"""
+    suite = SimpleStorageValidationTest()
+    try:
+        yield suite, suite._store_test_analyses()
+    finally:
+        suite.close()
+
+def _assert_category_passed(suite, category):
+    """Apply the report's validation criterion (>= 80% of checks passing) to one category"""
+    results = [test_data.get('success', False) for test in suite.test_results[category] for test_data in test.values()]
+    assert results and sum(results) / len(results) >= 0.8, f"{category}: {suite.test_results[category]}"
+
+def test_storage_validation(storage_suite):
+    suite, storage_ids = storage_suite
+    suite.test_storage_validation(storage_ids['storage_validation'])
+    _assert_category_passed(suite, 'storage_validation')
+
+def test_data_retrieval(storage_suite):
+    suite, storage_ids = storage_suite
+    suite.test_data_retrieval(storage_ids['data_retrieval'])
+    _assert_category_passed(suite, 'data_retrieval')
+
+def test_metrics_validation(storage_suite):
+    suite, storage_ids = storage_suite
+    suite.test_metrics_validation(storage_ids['metrics_validation'])
+    _assert_category_passed(suite, 'metrics_validation')
+
+def test_schema_migration(storage_suite):
+    suite, storage_ids = storage_suite
+    suite.test_schema_migration(storage_ids['schema_migration'])
+    _assert_category_passed(suite, 'schema_migration')
 
 if __name__ == "__main__":
     # Run simple storage validation test suite
@@ -5,9 +5,16 @@ Verifies existence, accessibility, and basic structure of target projects
 """
 
 import os
+import sys
 import json
 from datetime import datetime
 
+# Kept inline rather than using analyzer.json_utils so the script runs standalone
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def verify_project(project_path):
     """Verify a single project's existence, permissions, and structure"""
     result = {
@@ -20,29 +27,25 @@ def verify_project(project_path):
     }
     
     try:
-        # Check if project exists
-        if os.path.exists(project_path):
+        # Check if project exists with a single stat (os.path.exists also treats any OSError as missing)
+        try:
+            os.stat(project_path)
             result['exists'] = True
-            
-            # Check read permissions
-            if os.access(project_path, os.R_OK):
+        except OSError:
+            result['error'] = "Project path does not exist"
+        
+        if result['exists']:
+            # Listing the contents is the read check, so no separate os.access(R_OK) call
+            try:
+                with os.scandir(project_path) as entries:
+                    result['structure'] = sorted(entry.name for entry in entries)
                 result['readable'] = True
-                
-                # Check write permissions
-                if os.access(project_path, os.W_OK):
-                    result['writable'] = True
-                
-                # List basic structure
-                try:
-                    items = os.listdir(project_path)
-                    result['structure'] = sorted(items)
-                except PermissionError as e:
-                    result['error'] = f"Permission denied listing contents: {str(e)}"
-                    
-            else:
+            except PermissionError:
                 result['error'] = "Read permission denied"
-        else:
-            result['error'] = "Project path does not exist"
+            
+            # Check write permissions; os.access honours ACLs that st_mode bits do not show
+            if result['readable'] and os.access(project_path, os.W_OK):
+                result['writable'] = True
             
     except Exception as e:
         result['error'] = f"Unexpected error: {str(e)}"
@@ -90,41 +93,50 @@ def generate_verification_report():
 
 def save_report(report, filename='target_projects_verification_report.json'):
     """Save verification report to JSON file"""
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2)
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
     return filename
 
 def print_report_summary(report):
     """Print human-readable summary of verification report"""
-    print("=" * 60)
-    print("TARGET PROJECTS VERIFICATION REPORT")
-    print("=" * 60)
-    print(f"Generated: {report['timestamp']}")
-    print(f"Current Project: {report['current_project']}")
-    print()
+    buf = []
+    buf.append("=" * 60)
+    buf.append("TARGET PROJECTS VERIFICATION REPORT")
+    buf.append("=" * 60)
+    buf.append(f"Generated: {report['timestamp']}")
+    buf.append(f"Current Project: {report['current_project']}")
+    buf.append("")
     
-    print("SUMMARY:")
-    print(f"  Total Target Projects: {report['summary']['total_projects']}")
-    print(f"  Accessible Projects: {report['summary']['accessible_projects']}")
-    print(f"  Verification Status: {report['summary']['verification_status']}")
-    print()
+    buf.append("SUMMARY:")
+    buf.append(f"  Total Target Projects: {report['summary']['total_projects']}")
+    buf.append(f"  Accessible Projects: {report['summary']['accessible_projects']}")
+    buf.append(f"  Verification Status: {report['summary']['verification_status']}")
+    buf.append("")
     
     for project_name, project_data in report['target_projects'].items():
-        print(f"PROJECT: {project_name}")
-        print(f"  Path: {project_data['path']}")
-        print(f"  Exists: {project_data['exists']}")
-        print(f"  Readable: {project_data['readable']}")
-        print(f"  Writable: {project_data['writable']}")
+        buf.append(f"PROJECT: {project_name}")
+        buf.append(f"  Path: {project_data['path']}")
+        buf.append(f"  Exists: {project_data['exists']}")
+        buf.append(f"  Readable: {project_data['readable']}")
+        buf.append(f"  Writable: {project_data['writable']}")
         
         if project_data['error']:
-            print(f"  Error: {project_data['error']}")
+            buf.append(f"  Error: {project_data['error']}")
         else:
-            print(f"  Structure: {len(project_data['structure'])} items")
-            if project_data['structure']:
-                print(f"    - {', '.join(project_data['structure'][:10])}")
-                if len(project_data['structure']) > 10:
-                    print(f"    - ... and {len(project_data['structure']) - 10} more items")
-        print()
+            structure = project_data['structure']
+            buf.append(f"  Structure: {len(structure)} items")
+            if structure:
+                buf.append(f"    - {', '.join(structure[:10])}")
+                extra = len(structure) - 10
+                if extra > 0:
+                    buf.append(f"    - ... and {extra} more items")
+        buf.append("")
+    
+    sys.stdout.write("\n".join(buf) + "\n")
 
 if __name__ == "__main__":
     # Generate and save report
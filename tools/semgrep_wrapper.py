@@ -2,8 +2,15 @@ import subprocess
 import json
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 
+# Local fallback rather than analyzer.json_utils, since analyzer already imports tools
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class SemgrepWrapper:
     def __init__(self, semgrep_path: str = "semgrep"):
         self.semgrep_path = semgrep_path
@@ -13,24 +20,30 @@ class SemgrepWrapper:
         try:
             cmd = [self.semgrep_path, "--json", "--config", rules, codebase_path]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            else:
-                return {"error": result.stderr, "results": []}
+            # Spool stdout to a temporary file rather than growing it through the pipe in memory,
+            # and keep it as bytes so orjson can parse it without decoding to str first
+            with tempfile.TemporaryFile() as stdout_file:
+                result = subprocess.run(
+                    cmd,
+                    stdout=stdout_file,
+                    stderr=subprocess.PIPE,
+                    timeout=120
+                )
+                
+                if result.returncode == 0:
+                    stdout_file.seek(0)
+                    output = stdout_file.read()
+                    return orjson.loads(output) if orjson is not None else json.loads(output)
+                else:
+                    return {"error": result.stderr.decode(errors="replace"), "results": []}
                 
         except Exception as e:
             return {"error": str(e), "results": []}
     
     def analyze_multiple(self, codebase_paths: List[str]) -> Dict[str, Any]:
         """Analyze multiple codebases"""
-        all_results = {}
-        for path in codebase_paths:
-            all_results[path] = self.analyze(path)
-        return all_results
\ No newline at end of file
+        if not codebase_paths:
+            return {}
+        # Each analysis blocks on its own semgrep subprocess, so threads run them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(codebase_paths), os.cpu_count() or 1)) as executor:
+            return dict(zip(codebase_paths, executor.map(self.analyze, codebase_paths)))
\ No newline at end of file